@@ -14,7 +14,8 @@ from sklearn.neighbors import KNeighborsClassifier
 from sklearn.naive_bayes import GaussianNB
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix, f1_score
 from sklearn.preprocessing import LabelEncoder, StandardScaler, MinMaxScaler
-from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import cross_val_score, train_test_split
+from sklearn.base import clone
 import plotly.express as px
 import seaborn as sns
 import matplotlib.pyplot as plt
@@ -87,6 +88,7 @@ class MLRecommender:
         self.label_encoder = LabelEncoder()
         self.scaler = StandardScaler() if scaler_type == 'standard' else MinMaxScaler()
         self.feature_columns = None
+        self.calibrator = None
         
     def _create_model(self):
         """Create model with explicit parameter validation"""
@@ -115,8 +117,10 @@ class MLRecommender:
                 
             elif model_type == "SVM":
                 valid_params = {k: v for k, v in params.items() 
-                              if k in ['C', 'kernel', 'gamma', 'probability']}
-                return SVC(**valid_params, random_state=42)
+                              if k in ['C', 'kernel', 'gamma']}
+                # probability left off: calibration stage avoids SVC's internal Platt CV.
+                # break_ties makes predict agree with the argmax of the OvR scores.
+                return SVC(**valid_params, break_ties=True, random_state=42)
                 
             elif model_type == "Decision Tree":
                 valid_params = {k: v for k, v in params.items() 
@@ -166,17 +170,76 @@ class MLRecommender:
             # For prediction data, no labels needed
             return X, None, feature_cols
     
+    def needs_calibration(self):
+        """Models without native probabilities (e.g. SVM) need a calibration stage"""
+        return not hasattr(self.model, 'predict_proba')
+    
     def train(self, X_train, y_train):
-        """Train the model with bounds checking"""
+        """Train the model with bounds checking, calibrating probabilities if needed"""
         X_train_scaled = self.scaler.fit_transform(X_train)
-        self.model.fit(X_train_scaled, y_train)
         self.feature_columns = X_train.columns.tolist()
+        self.calibrator = None
+        
+        if self.needs_calibration():
+            self._fit_calibrator(X_train_scaled, y_train)
+        
+        # Final model always sees the full training set
+        self.model.fit(X_train_scaled, y_train)
+    
+    def _decision_scores(self, X_scaled, model=None):
+        """One score column per class (binary scores expanded to [-s, s])"""
+        scores = (model if model is not None else self.model).decision_function(X_scaled)
+        return np.column_stack([-scores, scores]) if scores.ndim == 1 else scores
+    
+    def _fit_calibrator(self, X_scaled, y):
+        """Fit calibration once on a training hold-out from decision-function scores.
+        
+        A single sigmoid is shared by all classes, so it is monotone and keeps the
+        SVM's ranking; it only sets confidence and never changes the predicted card.
+        Scores come from a clone fitted on the other 80%, while the final model is
+        refit on 100%, so confidence is approximate (most optimistic on training rows).
+        """
+        n_classes = len(np.unique(y))
+        n_hold = int(np.ceil(0.2 * len(y)))
+        stratify = y if np.bincount(y).min() >= 2 and n_hold >= n_classes else None
+        X_fit, X_hold, y_fit, y_hold = train_test_split(
+            X_scaled, y, test_size=n_hold, stratify=stratify, random_state=42)
         
+        # Score columns must line up with the final model, so every class must be fitted
+        if len(np.unique(y_fit)) < n_classes:
+            st.warning("⚠️ Too little training data for a calibration hold-out; "
+                       "confidence uses softmax of decision scores")
+            return
+        
+        holdout_model = clone(self.model).fit(X_fit, y_fit)
+        scores = self._decision_scores(X_hold, holdout_model)
+        # Pool every (row, class) score with whether that class is the true card
+        is_true = (holdout_model.classes_[None, :] == y_hold[:, None]).astype(int)
+        self.calibrator = LogisticRegression(max_iter=2000)
+        self.calibrator.fit(scores.reshape(-1, 1), is_true.ravel())
+    
+    def predict_proba(self, X_scaled):
+        """Class probabilities over all encoded classes"""
+        if not self.needs_calibration():
+            return self.model.predict_proba(X_scaled)
+        
+        n_classes = len(self.label_encoder.classes_)
+        scores = self._decision_scores(X_scaled)
+        
+        if self.calibrator is not None:
+            class_probs = self.calibrator.predict_proba(scores.reshape(-1, 1))[:, 1].reshape(scores.shape)
+        else:
+            class_probs = np.exp(scores - scores.max(axis=1, keepdims=True))
+        
+        probabilities = np.zeros((len(scores), n_classes))
+        probabilities[:, self.model.classes_] = class_probs / class_probs.sum(axis=1, keepdims=True)
+        return probabilities
+    
     def predict(self, X):
         """Make predictions with safety checks"""
         X_scaled = self.scaler.transform(X)
         predictions = self.model.predict(X_scaled)
-        probabilities = self.model.predict_proba(X_scaled)
+        probabilities = self.predict_proba(X_scaled)
         
         # Safety check: ensure predictions are within valid range
         n_classes = len(self.label_encoder.classes_)
@@ -256,8 +319,7 @@ with st.sidebar:
         kernel = st.selectbox("Kernel", ['rbf', 'linear', 'poly', 'sigmoid'])
         hyperparameters = {
             'C': st.slider("C Parameter", 0.1, 100.0, 1.0, 0.1),
-            'kernel': kernel,
-            'probability': True
+            'kernel': kernel
         }
         if kernel == 'rbf':
             hyperparameters['gamma'] = st.selectbox("Gamma", ['scale', 'auto'])